@@ -0,0 +1,253 @@
+import argparse
+import asyncio
+import random
+import secrets
+import time
+from collections import OrderedDict
+
+from smartRPS import beats, decide_winner, pick_ai_move
+
+# Line protocol (one command per line, UTF-8):
+#   NEW             -> OK <session_id>        start a fresh session
+#   RESUME <id>     -> OK <session_id>        continue an existing session
+#   PLAY <move>     -> OK <round> <you> <ai> <win|loss|tie> <your_wins> <ai_wins> <ties>
+#   STATS           -> OK session=<id> rock=<n> paper=<n> scissors=<n> score=<your_wins>/<ai_wins>/<ties>
+#   QUIT            -> BYE
+# The server greets each connection with "HELLO" but does not allocate anything
+# yet: the session is created by NEW, or by the first PLAY/STATS if the client
+# neither sent NEW nor RESUMEd. So a client that connects only to RESUME never
+# adds a session, and cannot push its own (or anyone's) session out of the LRU.
+# Sessions outlive connections, so a client can reconnect and RESUME until evicted.
+
+MOVES = tuple(beats)
+OUTCOMES = {"You win!": "win", "AI wins!": "loss", "Tie!": "tie"}
+
+
+# Per-player state. __slots__ keeps each session to a few small ints,
+# so thousands of idle sessions cost very little memory.
+class Session:
+    __slots__ = ("session_id", "rock", "paper", "scissors",
+                 "human_wins", "ai_wins", "ties", "last_seen")
+
+    def __init__(self, session_id, now):
+        self.session_id = session_id
+        self.rock = self.paper = self.scissors = 0
+        self.human_wins = self.ai_wins = self.ties = 0
+        self.last_seen = now
+
+    # Move counts in the shape pick_ai_move expects
+    def counts(self):
+        return {"rock": self.rock, "paper": self.paper, "scissors": self.scissors}
+
+    def rounds(self):
+        return self.human_wins + self.ai_wins + self.ties
+
+    def play(self, human, rng):
+        # Record human's play before AI makes its choice (same order as smartRPS.main)
+        setattr(self, human, getattr(self, human) + 1)
+        ai, _, _ = pick_ai_move(self.counts(), rng)
+        outcome = OUTCOMES[decide_winner(human, ai)]
+        if outcome == "win":
+            self.human_wins += 1
+        elif outcome == "loss":
+            self.ai_wins += 1
+        else:
+            self.ties += 1
+        return ai, outcome
+
+
+# Session table with LRU ordering and idle-time (TTL) eviction
+class SessionStore:
+    def __init__(self, ttl=300.0, max_sessions=10000, clock=time.monotonic):
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.clock = clock
+        self.sessions = OrderedDict()  # session_id -> Session, least recently used first
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def create(self):
+        session_id = secrets.token_hex(8)
+        while session_id in self.sessions:
+            session_id = secrets.token_hex(8)
+        self.sessions[session_id] = Session(session_id, self.clock())
+        # Over capacity: drop the least recently used sessions
+        while len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
+        return self.sessions[session_id]
+
+    def get(self, session_id):
+        session = self.sessions.get(session_id)
+        if session is None:
+            return None
+        now = self.clock()
+        if now - session.last_seen > self.ttl:
+            del self.sessions[session_id]
+            return None
+        session.last_seen = now
+        self.sessions.move_to_end(session_id)
+        return session
+
+    # Remove every session idle for longer than ttl; returns how many were dropped.
+    # The table is in LRU order, so we can stop at the first fresh session.
+    def evict_expired(self):
+        cutoff = self.clock() - self.ttl
+        evicted = 0
+        while self.sessions:
+            session = next(iter(self.sessions.values()))
+            if session.last_seen >= cutoff:
+                break
+            self.sessions.popitem(last=False)
+            evicted += 1
+        return evicted
+
+
+class RPSServer:
+    def __init__(self, host="127.0.0.1", port=5050, ttl=300.0, max_sessions=10000, seed=None, backlog=1024):
+        self.host = host
+        self.port = port
+        self.backlog = backlog  # asyncio's default of 100 pending connects is too small for bursts
+        self.store = SessionStore(ttl=ttl, max_sessions=max_sessions)
+        self.rng = random.Random(seed)
+        self.server = None
+        self.sweeper = None
+        self.clients = {}  # handler task -> writer, so stop() can close open connections
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port,
+                                                 backlog=self.backlog)
+        # The OS may pick the port when 0 is given; remember what we actually got
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.sweeper = asyncio.create_task(self.sweep())
+        return self.server
+
+    async def stop(self):
+        if self.sweeper is not None:
+            self.sweeper.cancel()
+            try:
+                await self.sweeper
+            except asyncio.CancelledError:
+                pass
+        if self.server is not None:
+            self.server.close()
+        # Closing a client's transport makes its pending readline() see EOF,
+        # so every handler finishes on its own and cleans up after itself
+        for writer in self.clients.values():
+            writer.close()
+        if self.clients:
+            await asyncio.gather(*self.clients, return_exceptions=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+
+    async def serve_forever(self):
+        await self.start()
+        print(f"Smart RPS server listening on {self.host}:{self.port}")
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    # Background task: drop idle sessions a couple of times per TTL window
+    async def sweep(self):
+        interval = max(self.store.ttl / 2, 0.1)
+        while True:
+            await asyncio.sleep(interval)
+            self.store.evict_expired()
+
+    # Turn one protocol line into (reply, session, keep_open)
+    def handle_line(self, line, session):
+        parts = line.split()
+        if not parts:
+            return "ERR empty command", session, True
+        command, args = parts[0].upper(), parts[1:]
+
+        if command == "QUIT":
+            return "BYE", session, False
+        if command == "NEW":
+            session = self.store.create()
+            return f"OK {session.session_id}", session, True
+        if command == "RESUME":
+            if len(args) != 1:
+                return "ERR usage: RESUME <session_id>", session, True
+            resumed = self.store.get(args[0])
+            if resumed is None:
+                return "ERR unknown session", session, True
+            return f"OK {resumed.session_id}", resumed, True
+
+        if command not in ("PLAY", "STATS"):
+            return f"ERR unknown command {parts[0]}", session, True
+        if command == "PLAY" and (len(args) != 1 or args[0].lower() not in MOVES):
+            return "ERR usage: PLAY rock|paper|scissors", session, True
+
+        # Everything below needs a session: start one on first use, or check
+        # that the current one was not evicted while the client sat idle
+        if session is None:
+            session = self.store.create()
+        else:
+            session = self.store.get(session.session_id)
+            if session is None:
+                return "ERR session expired, send NEW or RESUME", None, True
+
+        if command == "PLAY":
+            human = args[0].lower()
+            ai, outcome = session.play(human, self.rng)
+            return (f"OK {session.rounds()} {human} {ai} {outcome} "
+                    f"{session.human_wins} {session.ai_wins} {session.ties}"), session, True
+        if command == "STATS":
+            return (f"OK session={session.session_id} rock={session.rock} paper={session.paper} scissors={session.scissors} "
+                    f"score={session.human_wins}/{session.ai_wins}/{session.ties}"), session, True
+
+    async def handle_client(self, reader, writer):
+        task = asyncio.current_task()
+        self.clients[task] = writer
+        session = None
+        writer.write(b"HELLO\n")
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                reply, session, keep_open = self.handle_line(raw.decode("utf-8", "replace"), session)
+                writer.write(reply.encode() + b"\n")
+                await writer.drain()
+                if not keep_open:
+                    break
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            del self.clients[task]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-session Smart RPS server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5050)
+    parser.add_argument("--ttl", type=float, default=300.0, help="seconds before an idle session is evicted")
+    parser.add_argument("--max-sessions", type=int, default=10000, help="LRU capacity of the session table")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the AI's random opening moves")
+    parser.add_argument("--backlog", type=int, default=1024, help="pending connections the OS may queue")
+    args = parser.parse_args()
+    if args.ttl <= 0:
+        parser.error("--ttl must be positive")
+    if args.max_sessions < 1:
+        parser.error("--max-sessions must be at least 1")
+
+    server = RPSServer(args.host, args.port, args.ttl, args.max_sessions, args.seed, args.backlog)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    main()
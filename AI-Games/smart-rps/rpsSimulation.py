@@ -0,0 +1,188 @@
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from smartRPS import beats, decide_winner, pick_ai_move
+
+MOVES = tuple(beats)
+# The move that beats each move (beats maps winner -> loser, so invert it)
+beaten_by = {loser: winner for winner, loser in beats.items()}
+
+# Strategies are plain functions so they can be swapped in and shipped to worker processes:
+#   AI strategy:       ai(counts, rng) -> move          counts = human's move counts so far
+#   Opponent strategy: opponent(round_num, ai_history, ai_counts, rng) -> move
+#                      ai_counts = Counter of the AI's moves so far
+# Use module-level functions (or functools.partial of them) so they can be pickled.
+
+
+# ------------------------ AI Strategies ------------------------
+def smart_ai(counts, rng):
+    # The game's own AI from smartRPS.py
+    return pick_ai_move(counts, rng)[0]
+
+def random_ai(counts, rng):
+    return rng.choice(MOVES)
+
+
+# ------------------------ Opponent Strategies ------------------------
+def cyclic(round_num, ai_history, ai_counts, rng, sequence=MOVES):
+    # Repeat a fixed sequence: rock, paper, scissors, rock, ...
+    return sequence[(round_num - 1) % len(sequence)]
+
+def biased(round_num, ai_history, ai_counts, rng, weights=(0.5, 0.3, 0.2)):
+    # Favour some moves over others (weights follow MOVES order)
+    return rng.choices(MOVES, weights=weights)[0]
+
+def uniform(round_num, ai_history, ai_counts, rng):
+    return rng.choice(MOVES)
+
+def adaptive(round_num, ai_history, ai_counts, rng):
+    # Counter the AI's most frequent move so far
+    if not ai_history:
+        return rng.choice(MOVES)
+    most_common = max(MOVES, key=ai_counts.__getitem__)
+    return beaten_by[most_common]
+
+def copy_last(round_num, ai_history, ai_counts, rng):
+    # Beat whatever the AI just played
+    if not ai_history:
+        return rng.choice(MOVES)
+    return beaten_by[ai_history[-1]]
+
+OPPONENTS = {
+    "cyclic": cyclic,
+    "rock-heavy": partial(biased, weights=(0.6, 0.2, 0.2)),
+    "biased": biased,
+    "uniform": uniform,
+    "adaptive": adaptive,
+    "copy-last": copy_last,
+}
+
+
+# ------------------------ Simulation ------------------------
+# Every game gets its own RNG seeded from (seed, game_index), so results do not
+# depend on how games are split into batches or how many workers run them.
+# String seeds are hashed with SHA-512, so no two (seed, game_index) pairs share a stream.
+def game_rng(seed, game_index):
+    return random.Random(f"{seed}:{game_index}")
+
+def play_game(ai, opponent, rounds, rng):
+    counts = {move: 0 for move in MOVES}
+    ai_history = []
+    ai_counts = Counter()
+    human_wins = ai_wins = ties = 0
+
+    for round_num in range(1, rounds + 1):
+        human = opponent(round_num, ai_history, ai_counts, rng)
+        # Record human's play before AI makes its choice (same order as smartRPS.main)
+        counts[human] += 1
+        ai_move = ai(counts, rng)
+        ai_history.append(ai_move)
+        ai_counts[ai_move] += 1
+
+        result = decide_winner(human, ai_move)
+        if result == "You win!":
+            human_wins += 1
+        elif result == "AI wins!":
+            ai_wins += 1
+        else:
+            ties += 1
+    return human_wins, ai_wins, ties
+
+# Play games [first, last) and return the summed (human_wins, ai_wins, ties)
+def play_batch(ai, opponent, rounds, seed, first, last):
+    totals = [0, 0, 0]
+    for game_index in range(first, last):
+        for i, value in enumerate(play_game(ai, opponent, rounds, game_rng(seed, game_index))):
+            totals[i] += value
+    return tuple(totals)
+
+def split_batches(games, batch_size):
+    return [(first, min(first + batch_size, games)) for first in range(0, games, batch_size)]
+
+# Runs in each worker once before timing starts, so process start-up is not counted
+def warm_up(_):
+    return os.getpid()
+
+def simulate(ai=smart_ai, opponents=None, games=1000, rounds=50, seed=0, workers=None, batch_size=250):
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if opponents is None:
+        opponents = OPPONENTS
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    batches = split_batches(games, batch_size)
+
+    results = {}
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        if pool is not None:
+            # One task per worker at once makes the pool start all of its processes
+            list(pool.map(warm_up, range(workers)))
+        for name, opponent in opponents.items():
+            start = time.perf_counter()
+            if pool is None:
+                parts = [play_batch(ai, opponent, rounds, seed, first, last) for first, last in batches]
+            else:
+                futures = [pool.submit(play_batch, ai, opponent, rounds, seed, first, last)
+                           for first, last in batches]
+                parts = [future.result() for future in futures]
+            elapsed = time.perf_counter() - start
+
+            human_wins, ai_wins, ties = (sum(part[i] for part in parts) for i in range(3))
+            total_rounds = games * rounds
+            results[name] = {
+                "games": games,
+                "rounds": total_rounds,
+                "ai_wins": ai_wins,
+                "human_wins": human_wins,
+                "ties": ties,
+                "ai_win_rate": ai_wins / total_rounds if total_rounds else 0.0,
+                "human_win_rate": human_wins / total_rounds if total_rounds else 0.0,
+                "seconds": elapsed,
+                "rounds_per_second": total_rounds / elapsed if elapsed else float("inf"),
+            }
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return results
+
+def print_report(results):
+    print(f"{'Opponent':<12} {'AI win %':>9} {'Human win %':>12} {'Tie %':>7} {'Rounds/s':>12}")
+    for name, r in results.items():
+        tie_rate = r["ties"] / r["rounds"] if r["rounds"] else 0.0
+        print(f"{name:<12} {r['ai_win_rate'] * 100:>9.1f} {r['human_win_rate'] * 100:>12.1f} "
+              f"{tie_rate * 100:>7.1f} {r['rounds_per_second']:>12,.0f}")
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-simulate the Smart RPS AI against scripted opponents")
+    parser.add_argument("--games", type=positive_int, default=1000, help="games per opponent")
+    parser.add_argument("--rounds", type=positive_int, default=50, help="rounds per game")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=positive_int, default=None, help="worker processes (default: all cores, 1 = in-process)")
+    parser.add_argument("--batch-size", type=positive_int, default=250, help="games per worker task")
+    parser.add_argument("--opponents", nargs="+", choices=sorted(OPPONENTS), default=None)
+    args = parser.parse_args()
+
+    opponents = None
+    if args.opponents:
+        opponents = {name: OPPONENTS[name] for name in args.opponents}
+    results = simulate(smart_ai, opponents, args.games, args.rounds, args.seed, args.workers, args.batch_size)
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
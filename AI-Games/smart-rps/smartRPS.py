@@ -13,20 +13,24 @@ def get_human_choice():
         return get_human_choice()
     return choice
 
-def get_ai_choice():
-    total = sum(human_counts.values())
+# Pick the AI's move from a move-count table (no printing, no globals)
+# Returns (ai, reason, chance) so callers can explain the choice however they like
+def pick_ai_move(counts, rng=random):
+    total = sum(counts.values())
     # For the first few rounds, pick randomly
     if total <= 3:
-        ai = random.choice(list(human_counts))
-        reason = "used random choice because not enough data yet"
-        chance = None
-    else:
-        # find human's most frequent play, and pick the move that beats it
-        most_common = max(human_counts, key=human_counts.get)
-        ai = beats[beats[most_common]]  # AI picks what beats the human's most common move
-        chance = human_counts[most_common] / total * 100
-        reason = f"you played {most_common} {human_counts[most_common]} out of {total} times"
-    
+        ai = rng.choice(list(counts))
+        return ai, "used random choice because not enough data yet", None
+    # find human's most frequent play, and pick the move that beats it
+    most_common = max(counts, key=counts.get)
+    ai = beats[beats[most_common]]  # AI picks what beats the human's most common move
+    chance = counts[most_common] / total * 100
+    reason = f"you played {most_common} {counts[most_common]} out of {total} times"
+    return ai, reason, chance
+
+def get_ai_choice():
+    ai, reason, chance = pick_ai_move(human_counts)
+
     # Print explanation
     if chance is None:
         print(f"AI chose {ai} ({reason}).")
@@ -1,4 +1,5 @@
 import math
+from contextlib import nullcontext
 
 # --- Board & display ---
 # Initialize the game board with 9 empty spaces
@@ -28,87 +29,97 @@ def winner(b):
 
 # --- Minimax ---
 # Recursive minimax function to evaluate the best move
-def minimax(is_ai):
+# stats: optional SearchStats (see Algorithm-Implementation/searchStats.py); counting is off when None
+def minimax(is_ai, stats=None):
     # Check if the game has ended and return the score
     win = winner(board)
     if win=='O': return 1      # AI win
     if win=='X': return -1     # Human win
     if win=='Tie': return 0    # Draw
 
-    # Initialize best score based on the current player
-    best = -math.inf if is_ai else math.inf
-    mark = 'O' if is_ai else 'X'
+    with stats.outer_phase("minimax") if stats is not None else nullcontext():
+        # Initialize best score based on the current player
+        best = -math.inf if is_ai else math.inf
+        mark = 'O' if is_ai else 'X'
+        if stats is not None:
+            stats.expand()
 
-    # Iterate through all possible moves
-    for i in range(9):
-        if board[i]==' ':
-            # Make the move
-            board[i] = mark
-            # Recursively evaluate the move
-            score = minimax(not is_ai)
-            # Undo the move
-            board[i] = ' '
-            # Update the best score
-            if is_ai:
-                best = max(score, best)  # Maximize for AI
-            else:
-                best = min(score, best)  # Minimize for human
-    return best
+        # Iterate through all possible moves
+        for i in range(9):
+            if board[i]==' ':
+                # Make the move
+                board[i] = mark
+                if stats is not None:
+                    stats.generate()
+                # Recursively evaluate the move
+                score = minimax(not is_ai, stats)
+                # Undo the move
+                board[i] = ' '
+                # Update the best score
+                if is_ai:
+                    best = max(score, best)  # Maximize for AI
+                else:
+                    best = min(score, best)  # Minimize for human
+        return best
 
 # Function to determine the AI's best move
-def ai_move():
+def ai_move(stats=None):
     best_score, move = -math.inf, None
-    # Iterate through all possible moves
-    for i in range(9):
-        if board[i]==' ':
-            # Make the move
-            board[i] = 'O'
-            # Evaluate the move using minimax
-            score = minimax(False)
-            # Undo the move
-            board[i] = ' '
-            # Update the best move if the score is better
-            if score > best_score:
-                best_score, move = score, i
+    with stats.phase("search") if stats is not None else nullcontext():
+        # Iterate through all possible moves
+        for i in range(9):
+            if board[i]==' ':
+                # Make the move
+                board[i] = 'O'
+                if stats is not None:
+                    stats.generate()
+                # Evaluate the move using minimax
+                score = minimax(False, stats)
+                # Undo the move
+                board[i] = ' '
+                # Update the best move if the score is better
+                if score > best_score:
+                    best_score, move = score, i
     # Make the best move
     board[move] = 'O'
 
 # --- Main loop ---
-# Initialize the turn (X = human, O = AI)
-turn = 'X'  # X = human, O = AI
-while True:
-    # Display the current state of the board
-    show()
-    # Check for a winner or a tie
-    result = winner(board)
-    if result:
-        # Print the result and exit the loop
-        print(
-            "Result:",
-            "Draw" if result == 'Tie'
-            else ("AI wins!" if result == 'O' else "Human wins!")
-        )
-        break
+if __name__ == "__main__":
+    # Initialize the turn (X = human, O = AI)
+    turn = 'X'  # X = human, O = AI
+    while True:
+        # Display the current state of the board
+        show()
+        # Check for a winner or a tie
+        result = winner(board)
+        if result:
+            # Print the result and exit the loop
+            print(
+                "Result:",
+                "Draw" if result == 'Tie'
+                else ("AI wins!" if result == 'O' else "Human wins!")
+            )
+            break
 
-    # Handle the human player's turn
-    if turn=='X':
-        try:
-            # Get the human player's move
-            move = int(input("Your move (1–9): ")) - 1
-            # Check if the chosen spot is valid
-            if board[move] != ' ':
-                print("Spot taken!")
+        # Handle the human player's turn
+        if turn=='X':
+            try:
+                # Get the human player's move
+                move = int(input("Your move (1–9): ")) - 1
+                # Check if the chosen spot is valid
+                if board[move] != ' ':
+                    print("Spot taken!")
+                    continue
+                # Make the move
+                board[move] = 'X'
+            except:
+                # Handle invalid input
+                print("Invalid input.")
                 continue
-            # Make the move
-            board[move] = 'X'
-        except:
-            # Handle invalid input
-            print("Invalid input.")
-            continue
-    else:
-        # Handle the AI's turn
-        print("AI thinking...")
-        ai_move()
+        else:
+            # Handle the AI's turn
+            print("AI thinking...")
+            ai_move()
 
-    # Switch turns
-    turn = 'O' if turn=='X' else 'X'
+        # Switch turns
+        turn = 'O' if turn=='X' else 'X'
@@ -0,0 +1,2 @@
+# Benchmarks for the search algorithms in this folder.
+# Run from Algorithm-Implementation/ with:  python -m benchmarks --help
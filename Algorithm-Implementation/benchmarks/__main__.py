@@ -0,0 +1,75 @@
+import argparse
+import sys
+from pathlib import Path
+
+from .generators import GENERATORS
+from .runner import SEARCHES, compare, load_results, run_benchmarks, save_results
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+# 10^6 nodes peaks at roughly 1.2 GB RSS; 10^7 would need ten times that
+MAX_EXPONENT = 6
+
+
+def print_record(record):
+    memory = record["peak_memory_bytes"]
+    memory = f"{memory / 1024:>10.1f} KiB" if memory is not None else f"{'-':>14}"
+    print(f"{record['graph']:<11} {record['size']:>9} {record['search']:<14} "
+          f"{record['seconds']:>10.4f}s {memory} {record['nodes_expanded']:>10} expanded", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmark the search algorithms on seeded synthetic graphs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 4, 5], metavar="EXP",
+                        help=f"graph sizes as powers of ten, 3..{MAX_EXPONENT} (default: 3 4 5)")
+    parser.add_argument("--graphs", nargs="+", choices=list(GENERATORS), default=None)
+    parser.add_argument("--searches", nargs="+", choices=list(SEARCHES), default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", nargs="?", const=str(DEFAULT_BASELINE), default=None,
+                        help=f"compare against a stored run (default file: {DEFAULT_BASELINE.name})")
+    parser.add_argument("--save-baseline", nargs="?", const=str(DEFAULT_BASELINE), default=None,
+                        help="store this run as the new baseline")
+    parser.add_argument("--check-resources", action="store_true",
+                        help="also flag time and memory regressions; only meaningful against a "
+                             "baseline saved on this machine")
+    parser.add_argument("--time-tolerance", type=float, default=1.0,
+                        help="allowed relative slowdown (default: 1.0, i.e. twice as slow)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25, help="allowed relative memory growth")
+    args = parser.parse_args()
+
+    if any(not 3 <= exponent <= MAX_EXPONENT for exponent in args.sizes):
+        parser.error(f"--sizes takes exponents between 3 and {MAX_EXPONENT}; 10^7 nodes needs "
+                     f"well over 10 GB of RAM with these dict-of-lists graphs")
+    if MAX_EXPONENT in args.sizes:
+        print(f"Warning: 10^{MAX_EXPONENT} nodes peaks around 1.2 GB of RAM and takes a few minutes "
+              f"per graph type (geometric graphs stop at 10^5)\n")
+    sizes = [10 ** exponent for exponent in args.sizes]
+
+    results = run_benchmarks(sizes, args.graphs, args.searches, args.seed,
+                             track_memory=not args.no_memory, progress=print_record)
+
+    if args.output:
+        save_results(results, args.output, args.seed)
+    if args.save_baseline:
+        save_results(results, args.save_baseline, args.seed)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if args.baseline:
+        baseline = load_results(args.baseline)
+        if baseline.get("seed") != args.seed:
+            print(f"\nWarning: baseline was recorded with seed {baseline.get('seed')}, not {args.seed}")
+        regressions, changes = compare(results, baseline, args.check_resources,
+                                       args.time_tolerance, args.memory_tolerance)
+        for message in changes:
+            print(f"changed:    {message}")
+        for message in regressions:
+            print(f"REGRESSION: {message}")
+        if regressions:
+            sys.exit(1)
+        print("\nNo regressions against the baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import math
+import random
+from collections import defaultdict
+
+# Seeded synthetic graphs for the benchmarks. Every generator returns a
+# SyntheticGraph whose nodes are the ints 0..size-1, with undirected weighted
+# edges, a start/goal pair and an admissible heuristic towards that goal.
+
+
+class SyntheticGraph:
+    __slots__ = ("name", "size", "edges", "heuristics", "start", "goal")
+
+    def __init__(self, name, size, edges, heuristics, start, goal):
+        self.name = name
+        self.size = size              # number of nodes
+        self.edges = edges            # [(u, v, cost), ...] undirected
+        self.heuristics = heuristics  # heuristics[node] = h(node) towards goal
+        self.start = start
+        self.goal = goal
+
+    # Edges pointing from the lower to the higher node id. Local searches have
+    # no visited set and would loop forever on an undirected graph, so they get
+    # this acyclic version; generators number nodes so start -> goal runs "uphill".
+    def directed_edges(self):
+        for u, v, cost in self.edges:
+            yield (u, v, cost) if u < v else (v, u, cost)
+
+    def __repr__(self):
+        return f"SyntheticGraph({self.name}, size={self.size}, edges={len(self.edges)})"
+
+
+# ------------------------ Grid ------------------------
+# side x side 4-connected grid (size is rounded to a square), unit costs,
+# Manhattan-distance heuristic. Start is the top-left corner, goal the bottom-right.
+# The seed picks which cells are blocked (walls) when wall_ratio > 0.
+def grid_graph(size, seed=0, wall_ratio=0.0):
+    rng = random.Random(seed)
+    side = max(2, round(math.sqrt(size)))
+    n = side * side
+    start, goal = 0, n - 1
+    walls = set()
+    if wall_ratio > 0:
+        walls = {node for node in range(n) if rng.random() < wall_ratio} - {start, goal}
+
+    edges = []
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            if node in walls:
+                continue
+            if col + 1 < side and node + 1 not in walls:
+                edges.append((node, node + 1, 1))
+            if row + 1 < side and node + side not in walls:
+                edges.append((node, node + side, 1))
+
+    goal_row, goal_col = divmod(goal, side)
+    heuristics = {node: abs(goal_row - node // side) + abs(goal_col - node % side) for node in range(n)}
+    return SyntheticGraph("grid", n, edges, heuristics, start, goal)
+
+
+# ------------------------ Random Geometric ------------------------
+# Points uniform in the unit square, joined when closer than radius. Costs are
+# Euclidean lengths and the heuristic is straight-line distance (admissible).
+# Nodes are numbered left to right, start is the leftmost point, goal the rightmost.
+def geometric_graph(size, seed=0, radius=None):
+    rng = random.Random(seed)
+    if radius is None:
+        # A little above the connectivity threshold sqrt(ln n / (pi n))
+        radius = math.sqrt(2 * math.log(max(size, 2)) / (math.pi * size))
+    points = sorted((rng.random(), rng.random()) for _ in range(size))
+
+    # Bucket points into radius-sized cells so each point only checks nearby cells
+    cells = defaultdict(list)
+    for node, (x, y) in enumerate(points):
+        cells[(int(x / radius), int(y / radius))].append(node)
+
+    edges = []
+    radius_sq = radius * radius
+    for (cx, cy), members in cells.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for v in cells.get((cx + dx, cy + dy), ()):
+                    vx, vy = points[v]
+                    for u in members:
+                        if u < v:
+                            ux, uy = points[u]
+                            dist_sq = (ux - vx) ** 2 + (uy - vy) ** 2
+                            if dist_sq <= radius_sq:
+                                edges.append((u, v, math.sqrt(dist_sq)))
+
+    start, goal = 0, size - 1
+    gx, gy = points[goal]
+    heuristics = {node: math.hypot(x - gx, y - gy) for node, (x, y) in enumerate(points)}
+    return SyntheticGraph("geometric", size, edges, heuristics, start, goal)
+
+
+# ------------------------ Scale-Free ------------------------
+# Barabasi-Albert preferential attachment: each new node links to m existing
+# nodes picked in proportion to their degree. Unit costs, zero heuristic
+# (there is no geometry to estimate distance from), so A* behaves like Dijkstra.
+def scale_free_graph(size, seed=0, m=2):
+    rng = random.Random(seed)
+    m = max(1, min(m, size - 1))
+    edges = []
+    # Every node appears here once per edge end, so a uniform pick is degree-weighted
+    targets_pool = list(range(m))
+
+    for node in range(m, size):
+        chosen = set()
+        while len(chosen) < m:
+            chosen.add(rng.choice(targets_pool))
+        for target in chosen:
+            edges.append((target, node, 1))
+            targets_pool.append(target)
+            targets_pool.append(node)
+
+    heuristics = dict.fromkeys(range(size), 0)
+    return SyntheticGraph("scale-free", size, edges, heuristics, 0, size - 1)
+
+
+# ------------------------ Tree ------------------------
+# Random recursive tree: node i hangs under a uniformly chosen earlier node
+# (limited to max_children per parent). Unit costs. The goal is the deepest
+# node and the heuristic is the depth difference to it, which never overestimates.
+def tree_graph(size, seed=0, max_children=4):
+    rng = random.Random(seed)
+    depth = [0] * size
+    children = [0] * size
+    open_parents = [0]  # nodes that can still take a child
+    edges = []
+
+    for node in range(1, size):
+        index = rng.randrange(len(open_parents))
+        parent = open_parents[index]
+        edges.append((parent, node, 1))
+        depth[node] = depth[parent] + 1
+        children[parent] += 1
+        if children[parent] == max_children:
+            # swap-remove keeps this O(1)
+            open_parents[index] = open_parents[-1]
+            open_parents.pop()
+        open_parents.append(node)
+
+    goal = max(range(size), key=depth.__getitem__)
+    heuristics = {node: abs(depth[goal] - depth[node]) for node in range(size)}
+    return SyntheticGraph("tree", size, edges, heuristics, 0, goal)
+
+
+GENERATORS = {
+    "grid": grid_graph,
+    "geometric": geometric_graph,
+    "scale-free": scale_free_graph,
+    "tree": tree_graph,
+}
+
@@ -0,0 +1,232 @@
+import gc
+import importlib.util
+import json
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent  # Algorithm-Implementation/
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from searchStats import SearchStats  # noqa: E402
+
+from .generators import GENERATORS  # noqa: E402
+
+# IDS without a visited set grows exponentially with depth, so its depth is capped
+IDS_MAX_DEPTH = 3
+BEAM_WIDTH = 3
+
+# Short searches are timed several times and the fastest run is kept, which
+# irons out scheduler noise; long ones (over TIMING_BUDGET seconds) run once.
+MAX_TIMED_RUNS = 5
+TIMING_BUDGET = 0.25
+
+# Largest graph (in nodes) each (search, graph type) pair is run on; "*" is a wildcard.
+# dfs is recursive and runs out of stack past this. best_first_search pushes a
+# node again for every unvisited edge into it, so on scale-free hubs its queue
+# explodes (~25M expansions and ~2 minutes at 10^5 nodes). Geometric graphs
+# average ~2 ln n neighbours to stay connected, so 10^6 nodes means ~14M edges
+# and more than 5 GB once the informed graph is built.
+MAX_NODES = {
+    ("dfs", "*"): 100_000,
+    ("best_first", "scale-free"): 10_000,
+    ("*", "geometric"): 100_000,
+}
+
+# Every integer counter SearchStats exports (nodes, frontier, heap traffic,
+# prunes, cutoffs); these are deterministic for a seed and checked exactly
+COUNTERS = tuple(key for key, value in SearchStats().to_dict().items() if isinstance(value, int))
+
+
+# The algorithm folders have dashes in their names, so load the files directly
+def load_module(name, relative_path):
+    spec = importlib.util.spec_from_file_location(name, ROOT / relative_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+uninformed = load_module("unInformedSearches", "uninformed-searches/unInformedSearches.py")
+informed = load_module("informedSearches", "informed-searches/informedSearches.py")
+local = load_module("hillClimbingAndBeamSearch", "local-searches/hillClimbingAndBeamSearch.py")
+
+
+# ------------------------ Graph Builders ------------------------
+# Each family of searches wants its own graph class; build them from the same SyntheticGraph
+def build_uninformed(synthetic, searches=None):
+    g = uninformed.Graph()
+    for u, v, _ in synthetic.edges:
+        g.add_edges(u, v)
+    return g
+
+# The AND-OR copy of every edge is only needed by ao_star, so it is optional
+def build_informed(synthetic, and_or=True):
+    g = informed.InformedGraph()
+    for u, v, cost in synthetic.edges:
+        g.add_edge(u, v, cost)
+    if and_or:
+        for u, v, _ in synthetic.directed_edges():
+            g.add_and_or_edge(u, v, is_and=False)
+    for node, h in synthetic.heuristics.items():
+        g.set_heuristic(node, h)
+    return g
+
+def build_local(synthetic, searches=None):
+    search = local.SearchAlgorithms()
+    graph = {node: [] for node in range(synthetic.size)}
+    for u, v, _ in synthetic.directed_edges():
+        graph[u].append(v)
+    search.graph = graph
+    search.heuristics = synthetic.heuristics
+    return search
+
+BUILDERS = {
+    "uninformed": build_uninformed,
+    "informed": lambda synthetic, searches: build_informed(synthetic, and_or="ao_star" in searches),
+    "local": build_local,
+}
+
+
+# ------------------------ Searches ------------------------
+def run_dfs(g, s, stats):
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, s.size + 1000))
+    try:
+        g.dfs(s.start, stats=stats)
+    finally:
+        sys.setrecursionlimit(limit)
+
+# name -> (graph family, run(graph, synthetic, stats))
+SEARCHES = {
+    "bfs": ("uninformed", lambda g, s, stats: g.bfs(s.start, stats=stats)),
+    "dfs": ("uninformed", run_dfs),
+    "ids": ("uninformed", lambda g, s, stats: g.ids(s.start, s.goal, IDS_MAX_DEPTH, stats=stats)),
+    "bds": ("uninformed", lambda g, s, stats: g.bds(s.start, s.goal, stats=stats)),
+    "best_first": ("informed", lambda g, s, stats: g.best_first_search(s.start, s.goal, stats=stats)),
+    "a_star": ("informed", lambda g, s, stats: g.a_star_search(s.start, s.goal, stats=stats)),
+    "ao_star": ("informed", lambda g, s, stats: g.ao_star_search(s.start, s.goal, stats=stats)),
+    "hill_climbing": ("local", lambda g, s, stats: g.hill_climbing(s.start, s.goal, stats=stats)),
+    "beam": ("local", lambda g, s, stats: g.beam_search(s.start, s.goal, BEAM_WIDTH, stats=stats)),
+}
+
+
+def too_big(search_name, graph_name, size):
+    for key in ((search_name, graph_name), (search_name, "*"), ("*", graph_name)):
+        limit = MAX_NODES.get(key)
+        if limit is not None and size > limit:
+            return True
+    return False
+
+# Run one search with counters on. The searches print as they go, so stdout
+# goes to /dev/null. Memory is measured in a separate run because tracemalloc
+# slows Python down several times and would spoil the timing.
+def measure(run, graph, synthetic, track_memory, devnull):
+    stats = None
+    timings = []
+    gc.collect()
+    with redirect_stdout(devnull):
+        while len(timings) < MAX_TIMED_RUNS and sum(timings) < TIMING_BUDGET:
+            run_stats = SearchStats()
+            start = time.perf_counter()
+            run(graph, synthetic, run_stats)
+            timings.append(time.perf_counter() - start)
+            stats = stats or run_stats  # counters are identical on every run
+    seconds = min(timings)
+
+    record = {"seconds": seconds, "peak_memory_bytes": None}
+    record.update({key: value for key, value in stats.to_dict().items()
+                   if key not in ("peak_memory_bytes", "phase_seconds")})
+    record["phase_seconds"] = stats.phase_times
+
+    if track_memory:
+        memory_stats = SearchStats(track_memory=True)
+        gc.collect()
+        with redirect_stdout(devnull), memory_stats.phase("total"):
+            run(graph, synthetic, memory_stats)
+        record["peak_memory_bytes"] = memory_stats.peak_memory
+    return record
+
+
+def run_benchmarks(sizes, graphs=None, searches=None, seed=0, track_memory=True, progress=None):
+    graphs = graphs or list(GENERATORS)
+    searches = searches or list(SEARCHES)
+    results = []
+
+    with open(os.devnull, "w") as devnull:
+        for graph_name in graphs:
+            for size in sizes:
+                runnable = [name for name in searches if not too_big(name, graph_name, size)]
+                if not runnable:
+                    continue
+                synthetic = GENERATORS[graph_name](size, seed)
+                # Only one family's graph is alive at a time, so peak memory is
+                # the synthetic graph plus the largest single family
+                for family in BUILDERS:
+                    wanted = [name for name in runnable if SEARCHES[name][0] == family]
+                    if not wanted:
+                        continue
+                    graph = BUILDERS[family](synthetic, wanted)
+                    for search_name in wanted:
+                        record = measure(SEARCHES[search_name][1], graph, synthetic, track_memory, devnull)
+                        record = {"graph": graph_name, "size": size, "nodes": synthetic.size,
+                                  "edges": len(synthetic.edges), "search": search_name, **record}
+                        results.append(record)
+                        if progress is not None:
+                            progress(record)
+                    del graph
+                    gc.collect()
+                del synthetic
+    return results
+
+
+# ------------------------ Baselines ------------------------
+def result_key(record):
+    return f"{record['graph']}/{record['size']}/{record['search']}"
+
+def save_results(results, path, seed):
+    with open(path, "w") as f:
+        json.dump({"seed": seed, "results": results}, f, indent=2)
+        f.write("\n")
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+# Compare a run with a stored baseline. Work counters are deterministic for a
+# given seed, so any change there is reported. Time and memory depend on the
+# machine, so they are only checked when check_resources is set (against a
+# baseline saved on the same machine), and only count as regressions past a
+# relative tolerance plus an absolute floor, so noise on tiny runs is ignored.
+# Back-to-back runs on a busy machine differ by up to ~1.7x, hence the wide
+# default time tolerance; tighten it on a quiet machine.
+def compare(results, baseline, check_resources=False, time_tolerance=1.0, memory_tolerance=0.25,
+            min_seconds=0.05, min_bytes=64 * 1024):
+    previous = {result_key(record): record for record in baseline["results"]}
+    regressions, changes = [], []
+
+    for record in results:
+        key = result_key(record)
+        old = previous.get(key)
+        if old is None:
+            continue
+
+        for counter in COUNTERS:
+            if counter in old and record[counter] != old[counter]:
+                message = f"{key}: {counter} {old[counter]} -> {record[counter]}"
+                (regressions if record[counter] > old[counter] else changes).append(message)
+
+        if not check_resources:
+            continue
+
+        if (record["seconds"] > old["seconds"] * (1 + time_tolerance)
+                and record["seconds"] - old["seconds"] > min_seconds):
+            regressions.append(f"{key}: time {old['seconds']:.4f}s -> {record['seconds']:.4f}s")
+
+        old_memory, new_memory = old.get("peak_memory_bytes"), record.get("peak_memory_bytes")
+        if (old_memory and new_memory and new_memory > old_memory * (1 + memory_tolerance)
+                and new_memory - old_memory > min_bytes):
+            regressions.append(f"{key}: memory {old_memory} -> {new_memory} bytes")
+
+    return regressions, changes
@@ -1,20 +1,49 @@
 from collections import defaultdict
+from contextlib import nullcontext
+import hashlib
 import heapq
 
+FINGERPRINT_BITS = 128
+
+# Stable (unlike hash(), which is salted per process) 128-bit hash of one edge or heuristic
+def item_hash(item):
+    return int.from_bytes(hashlib.blake2b(repr(item).encode(), digest_size=16).digest(), "big")
+
 class InformedGraph:
     def __init__(self):
         self.graph = defaultdict(list)  # graph[node] = [(neighbor, cost), ...]
         self.heuristics = {}  # heuristics[node] = h(n)
         self.and_or_graph = defaultdict(list)  # Used for AO* Search
+        self.version = 0  # Bumped on every change that can alter A* results (see searchCache.py)
+        self._content_hash = None  # Sum of item hashes, kept up to date once fingerprint() is called
 
     # Add an undirected edge with a cost
     def add_edge(self, u, v, cost=1):
         self.graph[u].append((v, cost))
         self.graph[v].append((u, cost))
+        self.version += 1
+        if self._content_hash is not None:
+            self._content_hash += item_hash(("edge", u, v, cost)) + item_hash(("edge", v, u, cost))
 
     # Set heuristic value for a node
     def set_heuristic(self, node, value):
+        if self._content_hash is not None:
+            if node in self.heuristics:
+                self._content_hash -= item_hash(("h", node, self.heuristics[node]))
+            self._content_hash += item_hash(("h", node, value))
         self.heuristics[node] = value
+        self.version += 1
+
+    # Hex digest of the edges and heuristics, independent of insertion order.
+    # The first call hashes the whole graph; after that add_edge and
+    # set_heuristic keep it current in O(1), so graphs that never ask pay nothing.
+    def fingerprint(self):
+        if self._content_hash is None:
+            self._content_hash = sum(item_hash(("edge", u, v, cost))
+                                     for u, neighbors in self.graph.items() for v, cost in neighbors)
+            self._content_hash += sum(item_hash(("h", node, h)) for node, h in self.heuristics.items())
+        self._content_hash %= 1 << FINGERPRINT_BITS
+        return format(self._content_hash, f"0{FINGERPRINT_BITS // 4}x")
 
     # Add AND-OR graph edges (parent -> [(child, is_and)])
     def add_and_or_edge(self, parent, child, is_and=True):
@@ -26,82 +55,119 @@ class InformedGraph:
             print(f"{node} → {self.graph[node]}")
 
     # ------------------------ Best First Search ------------------------
-    def best_first_search(self, start, goal):
+    # stats: optional SearchStats (see ../searchStats.py); counting is off when None
+    def best_first_search(self, start, goal, stats=None):
         visited = set()
         pq = [(self.heuristics.get(start, float('inf')), start)]  # (heuristic, node)
 
         print("Best First Search Path: ", end='')
-        while pq:
-            _, current = heapq.heappop(pq)
-            if current == goal:
-                print(current)
-                return
-
-            visited.add(current)
-            print(current, end=' → ')
-
-            for neighbor, _ in self.graph.get(current, []):
-                if neighbor not in visited:
-                    heapq.heappush(pq, (self.heuristics.get(neighbor, float('inf')), neighbor))
+        with stats.phase("search") if stats is not None else nullcontext():
+            while pq:
+                _, current = heapq.heappop(pq)
+                if stats is not None:
+                    stats.pop()
+                if current == goal:
+                    print(current)
+                    return
+
+                visited.add(current)
+                if stats is not None:
+                    stats.expand()
+                print(current, end=' → ')
+
+                for neighbor, _ in self.graph.get(current, []):
+                    if neighbor not in visited:
+                        heapq.heappush(pq, (self.heuristics.get(neighbor, float('inf')), neighbor))
+                        if stats is not None:
+                            stats.push(len(pq))
 
         print("Goal not reachable")             
             
         
 
     # ------------------------ A* Search ------------------------
-    def a_star_search(self, start, goal):
+    # cache: optional SearchCache (see searchCache.py); returns (path, cost) or None
+    def a_star_search(self, start, goal, stats=None, cache=None):
+        if cache is not None:
+            cached = cache.get(self, start, goal)
+            if cached is not None:
+                print("A* Search Path: ", " → ".join(map(str, cached[0])))
+                return cached
+
         open_set = [(self.heuristics.get(start, float('inf')), 0, start)]  # (f = g + h, g, node)
         came_from = {}
         g_cost = {start: 0}
 
-        while open_set:
-            _, g, current = heapq.heappop(open_set)
-
-            if current == goal:
-                path = self.reconstruct_path(came_from, current)
-                print("A* Search Path: ", " → ".join(path))
-                return
-
-            for neighbor, cost in self.graph.get(current, []):
-                new_g = g + cost
-                if neighbor not in g_cost or new_g < g_cost[neighbor]:
-                    g_cost[neighbor] = new_g
-                    f = new_g + self.heuristics.get(neighbor, float('inf'))
-                    heapq.heappush(open_set, (f, new_g, neighbor))
-                    came_from[neighbor] = current
+        with stats.phase("search") if stats is not None else nullcontext():
+            while open_set:
+                _, g, current = heapq.heappop(open_set)
+                if stats is not None:
+                    stats.pop()
+
+                if current == goal:
+                    with stats.phase("reconstruct") if stats is not None else nullcontext():
+                        path = self.reconstruct_path(came_from, current)
+                    print("A* Search Path: ", " → ".join(map(str, path)))
+                    prefix_costs = [g_cost[node] for node in path]
+                    if cache is not None:
+                        cache.put(self, path, prefix_costs)
+                    return path, prefix_costs[-1]
+
+                if stats is not None:
+                    stats.expand()
+                for neighbor, cost in self.graph.get(current, []):
+                    new_g = g + cost
+                    if neighbor not in g_cost or new_g < g_cost[neighbor]:
+                        g_cost[neighbor] = new_g
+                        f = new_g + self.heuristics.get(neighbor, float('inf'))
+                        heapq.heappush(open_set, (f, new_g, neighbor))
+                        came_from[neighbor] = current
+                        if stats is not None:
+                            stats.push(len(open_set))
 
         print("Goal not reachable")
+        return None
 
     # ------------------------ AO* Search ------------------------
-    def ao_star_search(self, start, goal):
+    def ao_star_search(self, start, goal, stats=None):
         # AO* works with AND-OR graphs
         open_set = [(0, start)]  # (cost, node)
         best_cost = {start: 0}
         node_parent = {start: None}
 
-        while open_set:
-            cost, current = heapq.heappop(open_set)
-
-            # If we reach the goal, trace the path
-            if current == goal:
-                path = self.reconstruct_ao_path(node_parent, current)
-                print("AO* Search Path: ", " → ".join(path))
-                return
-
-            # Explore neighbors from AND-OR graph
-            for neighbor, is_and in self.and_or_graph[current]:
-                # If it's an AND node, all children must be valid
-                if is_and:
-                    if neighbor not in best_cost or cost + 1 < best_cost[neighbor]:
-                        best_cost[neighbor] = cost + 1
-                        heapq.heappush(open_set, (cost + 1, neighbor))
-                        node_parent[neighbor] = current
-                else:
-                    # If it's an OR node, any valid child is sufficient
-                    if neighbor not in best_cost or cost + 1 < best_cost[neighbor]:
-                        best_cost[neighbor] = cost + 1
-                        heapq.heappush(open_set, (cost + 1, neighbor))
-                        node_parent[neighbor] = current
+        with stats.phase("search") if stats is not None else nullcontext():
+            while open_set:
+                cost, current = heapq.heappop(open_set)
+                if stats is not None:
+                    stats.pop()
+
+                # If we reach the goal, trace the path
+                if current == goal:
+                    with stats.phase("reconstruct") if stats is not None else nullcontext():
+                        path = self.reconstruct_ao_path(node_parent, current)
+                    print("AO* Search Path: ", " → ".join(map(str, path)))
+                    return
+
+                if stats is not None:
+                    stats.expand()
+                # Explore neighbors from AND-OR graph
+                for neighbor, is_and in self.and_or_graph[current]:
+                    # If it's an AND node, all children must be valid
+                    if is_and:
+                        if neighbor not in best_cost or cost + 1 < best_cost[neighbor]:
+                            best_cost[neighbor] = cost + 1
+                            heapq.heappush(open_set, (cost + 1, neighbor))
+                            node_parent[neighbor] = current
+                            if stats is not None:
+                                stats.push(len(open_set))
+                    else:
+                        # If it's an OR node, any valid child is sufficient
+                        if neighbor not in best_cost or cost + 1 < best_cost[neighbor]:
+                            best_cost[neighbor] = cost + 1
+                            heapq.heappush(open_set, (cost + 1, neighbor))
+                            node_parent[neighbor] = current
+                            if stats is not None:
+                                stats.push(len(open_set))
 
         print("Goal not reachable")
 
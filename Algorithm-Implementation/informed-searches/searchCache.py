@@ -0,0 +1,176 @@
+import ast
+import sqlite3
+import weakref
+from collections import OrderedDict, defaultdict
+
+# Result cache for InformedGraph.a_star_search: (start, goal) -> (path, cost).
+#
+#   cache = SearchCache(capacity=1024, db_path="astar.sqlite", namespace="city-map")
+#   g.a_star_search('A', 'E', cache=cache)
+#
+# In memory, entries belong to one graph object (held by weakref) at one value
+# of its version counter, which add_edge and set_heuristic bump. A lookup with
+# another graph or a newer version throws the in-memory entries away. Changing
+# g.graph or g.heuristics directly skips the counter, so it is not noticed.
+#
+# Any part of an optimal path is itself optimal, so if a cached path runs
+# through both endpoints of a new query the answer is sliced out of it. That
+# relies on A* returning optimal paths, i.e. on a consistent heuristic.
+#
+# The SQLite tier (db_path) keeps results across runs and processes. Rows are
+# keyed on graph.fingerprint(), a hash of the graph's edges and heuristics, so
+# a row is only served for a graph with exactly the same contents and can never
+# be stale. Rows for old contents are therefore left in place (another process,
+# or a restart that rebuilds the same graph, can still use them); clear()
+# empties the namespace. Results are stored as repr() text and read back with
+# ast.literal_eval, so nodes must be plain literals (str, int, tuple, ...);
+# paths that do not round-trip are kept in memory only.
+
+
+class SearchCache:
+    def __init__(self, capacity=1024, db_path=None, namespace="default"):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.namespace = namespace
+        self.entries = OrderedDict()           # (start, goal) -> (path, prefix_costs), least recently used first
+        self.paths_through = defaultdict(set)  # node -> keys of cached paths that visit it
+        self.graph_ref = None   # weakref to the graph the entries belong to
+        self.version = None
+        self.fingerprint = None  # content hash of that graph, only needed for the SQLite tier
+        self.hits = self.subpath_hits = self.disk_hits = self.misses = 0
+
+        self.db = None
+        if db_path is not None:
+            self.db = sqlite3.connect(db_path)
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS astar_paths ("
+                " namespace TEXT, fingerprint TEXT, start TEXT, goal TEXT, result TEXT,"
+                " PRIMARY KEY (namespace, fingerprint, start, goal))"
+            )
+            self.db.commit()
+
+    def __len__(self):
+        return len(self.entries)
+
+    # ------------------------ Lookup ------------------------
+    # Returns (path, cost) or None
+    def get(self, graph, start, goal):
+        self.sync(graph)
+        key = (start, goal)
+
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[0]), entry[1][-1]
+
+        result = self.find_subpath(start, goal)
+        if result is not None:
+            self.subpath_hits += 1
+            return result
+
+        if self.db is not None:
+            row = self.db.execute(
+                "SELECT result FROM astar_paths WHERE namespace = ? AND fingerprint = ? AND start = ? AND goal = ?",
+                (self.namespace, self.fingerprint, repr(start), repr(goal)),
+            ).fetchone()
+            result = parse_result(row[0]) if row is not None else None
+            if result is not None:
+                path, prefix_costs = result
+                self.remember(key, path, prefix_costs)
+                self.disk_hits += 1
+                return list(path), prefix_costs[-1]
+
+        self.misses += 1
+        return None
+
+    # Slice (start, goal) out of any cached path that visits both nodes
+    def find_subpath(self, start, goal):
+        through_start = self.paths_through.get(start)
+        through_goal = self.paths_through.get(goal)
+        if not through_start or not through_goal:
+            return None
+        for key in through_start & through_goal:
+            path, prefix_costs = self.entries[key]
+            i, j = path.index(start), path.index(goal)
+            self.entries.move_to_end(key)
+            if i <= j:
+                return list(path[i:j + 1]), prefix_costs[j] - prefix_costs[i]
+            # Edges are undirected, so the path also works backwards
+            return list(reversed(path[j:i + 1])), prefix_costs[i] - prefix_costs[j]
+        return None
+
+    # ------------------------ Store ------------------------
+    # prefix_costs[k] is the cost from path[0] to path[k] (A*'s g values)
+    def put(self, graph, path, prefix_costs):
+        self.sync(graph)
+        path, prefix_costs = tuple(path), tuple(prefix_costs)
+        key = (path[0], path[-1])
+        self.remember(key, path, prefix_costs)
+
+        if self.db is not None:
+            text = repr((path, prefix_costs))
+            if parse_result(text) == (path, prefix_costs):
+                self.db.execute(
+                    "INSERT OR REPLACE INTO astar_paths VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, self.fingerprint, repr(key[0]), repr(key[1]), text),
+                )
+                self.db.commit()
+
+    def remember(self, key, path, prefix_costs):
+        if key in self.entries:
+            self.forget(key)
+        self.entries[key] = (path, prefix_costs)
+        for node in path:
+            self.paths_through[node].add(key)
+        while len(self.entries) > self.capacity:
+            self.forget(next(iter(self.entries)))
+
+    def forget(self, key):
+        path, _ = self.entries.pop(key)
+        for node in path:
+            keys = self.paths_through[node]
+            keys.discard(key)
+            if not keys:
+                del self.paths_through[node]
+
+    # ------------------------ Invalidation ------------------------
+    # Drop the in-memory entries when the graph object or its version changes.
+    # The weakref only matches while that exact object is alive, so a new graph
+    # that happens to reuse a freed graph's id() is not mistaken for it.
+    def sync(self, graph):
+        if self.graph_ref is not None and self.graph_ref() is graph and self.version == graph.version:
+            return
+        self.entries.clear()
+        self.paths_through.clear()
+        self.graph_ref = weakref.ref(graph)
+        self.version = graph.version
+        if self.db is not None:
+            self.fingerprint = graph.fingerprint()
+
+    def clear(self):
+        self.entries.clear()
+        self.paths_through.clear()
+        if self.db is not None:
+            self.db.execute("DELETE FROM astar_paths WHERE namespace = ?", (self.namespace,))
+            self.db.commit()
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def stats(self):
+        return {"hits": self.hits, "subpath_hits": self.subpath_hits,
+                "disk_hits": self.disk_hits, "misses": self.misses, "entries": len(self.entries)}
+
+
+# ------------------------ Helpers ------------------------
+# (path, prefix_costs) from its stored repr, or None if the text is not a valid literal
+def parse_result(text):
+    try:
+        path, prefix_costs = ast.literal_eval(text)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return None
+    return tuple(path), tuple(prefix_costs)
@@ -0,0 +1,129 @@
+import gc
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from informedSearches import InformedGraph
+from searchCache import SearchCache
+
+# Run with: python -m unittest test_searchCache   (from this folder)
+
+
+def build_graph(ab_cost=1):
+    g = InformedGraph()
+    for u, v, cost in (("A", "B", ab_cost), ("B", "C", 2), ("C", "D", 1), ("D", "E", 3), ("A", "E", 10)):
+        g.add_edge(u, v, cost)
+    for node in "ABCDE":
+        g.set_heuristic(node, 0)  # h = 0 is consistent, so A* paths are optimal
+    return g
+
+def search(g, start, goal, cache):
+    with redirect_stdout(io.StringIO()):
+        return g.a_star_search(start, goal, cache=cache)
+
+
+class SearchCacheTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix=".sqlite")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.db_path)
+
+    def test_repeat_query_is_a_hit(self):
+        cache = SearchCache()
+        g = build_graph()
+        self.assertEqual(search(g, "A", "E", cache), (["A", "B", "C", "D", "E"], 7))
+        self.assertEqual(search(g, "A", "E", cache), (["A", "B", "C", "D", "E"], 7))
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_add_edge_invalidates(self):
+        cache = SearchCache()
+        g = build_graph()
+        search(g, "A", "E", cache)
+        g.add_edge("A", "D", 1)
+        self.assertEqual(search(g, "A", "E", cache), (["A", "D", "E"], 4))
+        self.assertEqual(cache.stats()["hits"], 0)
+
+    def test_subpath_is_sliced_both_ways(self):
+        cache = SearchCache()
+        g = build_graph()
+        search(g, "A", "E", cache)
+        self.assertEqual(search(g, "B", "D", cache), (["B", "C", "D"], 3))
+        self.assertEqual(search(g, "D", "B", cache), (["D", "C", "B"], 3))
+        self.assertEqual(cache.stats()["subpath_hits"], 2)
+
+    def test_new_graph_with_reused_id_is_not_a_hit(self):
+        cache = SearchCache()
+        for ab_cost, expected in ((1, 7), (20, 10), (1, 7), (20, 10)):
+            g = build_graph(ab_cost)
+            self.assertEqual(search(g, "A", "E", cache)[1], expected)
+            del g
+            gc.collect()  # lets CPython hand the freed id to the next graph
+        self.assertEqual(cache.stats()["hits"], 0)
+
+    def test_disk_tier_round_trip(self):
+        first = SearchCache(db_path=self.db_path)
+        search(build_graph(), "A", "E", first)
+        first.close()
+
+        second = SearchCache(db_path=self.db_path)
+        self.assertEqual(search(build_graph(), "A", "E", second), (["A", "B", "C", "D", "E"], 7))
+        self.assertEqual(second.stats()["disk_hits"], 1)
+        second.close()
+
+    def test_disk_tier_ignores_rows_for_other_contents(self):
+        first = SearchCache(db_path=self.db_path)
+        search(build_graph(ab_cost=1), "A", "E", first)
+        first.close()
+
+        second = SearchCache(db_path=self.db_path)
+        self.assertEqual(search(build_graph(ab_cost=20), "A", "E", second), (["A", "E"], 10))
+        self.assertEqual(second.stats()["disk_hits"], 0)
+        second.close()
+
+    def test_editing_one_graph_keeps_rows_for_others(self):
+        first = SearchCache(db_path=self.db_path)
+        g = build_graph()
+        search(g, "A", "E", first)
+        g.add_edge("A", "D", 1)
+        search(g, "A", "E", first)
+
+        second = SearchCache(db_path=self.db_path)
+        self.assertEqual(search(build_graph(), "A", "E", second), (["A", "B", "C", "D", "E"], 7))
+        self.assertEqual(second.stats()["disk_hits"], 1)
+        first.close()
+        second.close()
+
+    def test_lru_evicts_oldest(self):
+        cache = SearchCache(capacity=1)
+        g = build_graph()
+        search(g, "A", "B", cache)
+        search(g, "D", "E", cache)
+        self.assertEqual(list(cache.entries), [("D", "E")])
+
+    def test_capacity_must_be_positive(self):
+        for capacity in (0, -1):
+            with self.assertRaises(ValueError):
+                SearchCache(capacity=capacity)
+
+
+class FingerprintTest(unittest.TestCase):
+    def test_incremental_matches_full(self):
+        g = build_graph()
+        g.fingerprint()  # switch on incremental updates
+        g.add_edge("E", "F", 2)
+        g.set_heuristic("A", 5)
+        fresh = build_graph()
+        fresh.set_heuristic("A", 5)
+        fresh.add_edge("E", "F", 2)
+        self.assertEqual(g.fingerprint(), fresh.fingerprint())
+
+    def test_contents_change_fingerprint(self):
+        self.assertNotEqual(build_graph(1).fingerprint(), build_graph(2).fingerprint())
+
+
+if __name__ == "__main__":
+    unittest.main()
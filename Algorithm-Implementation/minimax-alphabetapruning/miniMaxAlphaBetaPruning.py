@@ -1,9 +1,13 @@
+from contextlib import nullcontext
+
+
 class MinMaxAlphaBeta:
     def __init__(self):
         self.max_player = 'X'  # AI
         self.min_player = 'O'  # Human
 
-    def min_max(self, board, depth, is_maximizing):
+    # stats: optional SearchStats (see ../searchStats.py); counting is off when None
+    def min_max(self, board, depth, is_maximizing, stats=None):
         winner = self.check_winner(board)
         if winner == self.max_player:
             return 1
@@ -12,20 +16,27 @@ class MinMaxAlphaBeta:
         elif not any(cell == ' ' for row in board for cell in row):
             return 0
 
-        if is_maximizing:
-            best = -float('inf')
-            for move in self.get_possible_moves(board):
-                new_board = self.make_move(board, move, self.max_player)
-                best = max(best, self.min_max(new_board, depth + 1, False))
-            return best
-        else:
-            best = float('inf')
-            for move in self.get_possible_moves(board):
-                new_board = self.make_move(board, move, self.min_player)
-                best = min(best, self.min_max(new_board, depth + 1, True))
-            return best
+        with stats.outer_phase("min_max") if stats is not None else nullcontext():
+            if stats is not None:
+                stats.expand()
+            if is_maximizing:
+                best = -float('inf')
+                for move in self.get_possible_moves(board):
+                    new_board = self.make_move(board, move, self.max_player)
+                    if stats is not None:
+                        stats.generate()
+                    best = max(best, self.min_max(new_board, depth + 1, False, stats))
+                return best
+            else:
+                best = float('inf')
+                for move in self.get_possible_moves(board):
+                    new_board = self.make_move(board, move, self.min_player)
+                    if stats is not None:
+                        stats.generate()
+                    best = min(best, self.min_max(new_board, depth + 1, True, stats))
+                return best
 
-    def alpha_beta(self, board, depth, is_maximizing, alpha, beta):
+    def alpha_beta(self, board, depth, is_maximizing, alpha, beta, stats=None):
         winner = self.check_winner(board)
         if winner == self.max_player:
             return 1
@@ -34,34 +45,48 @@ class MinMaxAlphaBeta:
         elif not any(cell == ' ' for row in board for cell in row):
             return 0
 
-        if is_maximizing:
-            best = -float('inf')
-            for move in self.get_possible_moves(board):
-                new_board = self.make_move(board, move, self.max_player)
-                best = max(best, self.alpha_beta(new_board, depth + 1, False, alpha, beta))
-                alpha = max(alpha, best)
-                if beta <= alpha:
-                    break
-            return best
-        else:
-            best = float('inf')
-            for move in self.get_possible_moves(board):
-                new_board = self.make_move(board, move, self.min_player)
-                best = min(best, self.alpha_beta(new_board, depth + 1, True, alpha, beta))
-                beta = min(beta, best)
-                if beta <= alpha:
-                    break
-            return best
-
-    def get_best_move(self, board, is_maximizing):
+        with stats.outer_phase("alpha_beta") if stats is not None else nullcontext():
+            if stats is not None:
+                stats.expand()
+            if is_maximizing:
+                best = -float('inf')
+                for move in self.get_possible_moves(board):
+                    new_board = self.make_move(board, move, self.max_player)
+                    if stats is not None:
+                        stats.generate()
+                    best = max(best, self.alpha_beta(new_board, depth + 1, False, alpha, beta, stats))
+                    alpha = max(alpha, best)
+                    if beta <= alpha:
+                        if stats is not None:
+                            stats.prune()
+                        break
+                return best
+            else:
+                best = float('inf')
+                for move in self.get_possible_moves(board):
+                    new_board = self.make_move(board, move, self.min_player)
+                    if stats is not None:
+                        stats.generate()
+                    best = min(best, self.alpha_beta(new_board, depth + 1, True, alpha, beta, stats))
+                    beta = min(beta, best)
+                    if beta <= alpha:
+                        if stats is not None:
+                            stats.prune()
+                        break
+                return best
+
+    def get_best_move(self, board, is_maximizing, stats=None):
         best_move = None
         best_value = -float('inf') if is_maximizing else float('inf')
-        for move in self.get_possible_moves(board):
-            new_board = self.make_move(board, move, self.max_player if is_maximizing else self.min_player)
-            board_value = self.alpha_beta(new_board, 0, not is_maximizing, -float('inf'), float('inf'))
-            if (is_maximizing and board_value > best_value) or (not is_maximizing and board_value < best_value):
-                best_value = board_value
-                best_move = move
+        with stats.phase("search") if stats is not None else nullcontext():
+            for move in self.get_possible_moves(board):
+                new_board = self.make_move(board, move, self.max_player if is_maximizing else self.min_player)
+                if stats is not None:
+                    stats.generate()
+                board_value = self.alpha_beta(new_board, 0, not is_maximizing, -float('inf'), float('inf'), stats)
+                if (is_maximizing and board_value > best_value) or (not is_maximizing and board_value < best_value):
+                    best_value = board_value
+                    best_move = move
         return best_move
 
     def get_possible_moves(self, board):
@@ -0,0 +1,144 @@
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+# Shared work counter for the search algorithms in this folder (and the games).
+# Every search takes an optional `stats=` argument; pass a SearchStats to turn
+# counting on for that call. With the default stats=None nothing is recorded,
+# so the only cost is one `is not None` check at each counting point.
+#
+#   stats = SearchStats(track_memory=True)
+#   g.a_star_search('A', 'E', stats=stats)
+#   print(stats.to_json())
+#
+# The search modules never import this file; anything with the same methods works.
+#
+# Memory is only traced inside a phase. Every search entry point opens one, so
+# peak_memory_bytes is filled in; if tracking is on but no phase ever ran, it is
+# exported as None (not measured) rather than 0.
+
+
+class SearchStats:
+    __slots__ = ("nodes_expanded", "nodes_generated", "peak_frontier",
+                 "heap_pushes", "heap_pops", "prunes", "cutoffs",
+                 "phase_times", "peak_memory", "track_memory",
+                 "_phase_starts", "_memory_depth", "_memory_base", "_started_tracing")
+
+    def __init__(self, track_memory=False):
+        self.nodes_expanded = 0    # nodes taken off the frontier and explored
+        self.nodes_generated = 0   # successors created / added to the frontier
+        self.peak_frontier = 0     # largest open list / queue / beam seen
+        self.heap_pushes = 0
+        self.heap_pops = 0
+        self.prunes = 0            # alpha-beta cutoffs, beam entries dropped
+        self.cutoffs = 0           # depth-limit cutoffs
+        self.phase_times = {}      # phase name -> total seconds
+        self.peak_memory = None    # bytes allocated on top of what was live when tracking began
+        self.track_memory = track_memory
+        self._phase_starts = {}    # phase name -> stack of start times (phases may re-enter)
+        self._memory_depth = 0
+        self._memory_base = 0
+        self._started_tracing = False
+
+    # ------------------------ Counters ------------------------
+    def expand(self):
+        self.nodes_expanded += 1
+
+    def generate(self, count=1):
+        self.nodes_generated += count
+
+    def frontier(self, size):
+        if size > self.peak_frontier:
+            self.peak_frontier = size
+
+    def push(self, frontier_size):
+        self.heap_pushes += 1
+        self.nodes_generated += 1
+        if frontier_size > self.peak_frontier:
+            self.peak_frontier = frontier_size
+
+    def pop(self):
+        self.heap_pops += 1
+
+    def prune(self, count=1):
+        self.prunes += count
+
+    def cutoff(self):
+        self.cutoffs += 1
+
+    # ------------------------ Phases ------------------------
+    # Phases may nest (e.g. "reconstruct" inside "search"), even under the same
+    # name, as in `with stats.phase("search"): g.a_star_search(..., stats=stats)`.
+    # Each name keeps its own total; a re-entered name only counts the outer span.
+    def start_phase(self, name):
+        if self.track_memory:
+            self._start_memory()
+        self._phase_starts.setdefault(name, []).append(time.perf_counter())
+
+    def end_phase(self, name):
+        starts = self._phase_starts[name]
+        elapsed = time.perf_counter() - starts.pop()
+        if not starts:
+            del self._phase_starts[name]
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + elapsed
+        if self.track_memory:
+            self._stop_memory()
+
+    @contextmanager
+    def phase(self, name):
+        self.start_phase(name)
+        try:
+            yield self
+        finally:
+            self.end_phase(name)
+
+    # For recursive searches: only the outermost call opens the phase, so deeper
+    # calls cost one dict lookup instead of a timer read and a stack push
+    def outer_phase(self, name):
+        if name in self._phase_starts:
+            return nullcontext()
+        return self.phase(name)
+
+    def _start_memory(self):
+        if self._memory_depth == 0:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            # Tracing may already have been on; only count what the phase adds
+            self._memory_base = tracemalloc.get_traced_memory()[0]
+        self._memory_depth += 1
+
+    def _stop_memory(self):
+        self._memory_depth -= 1
+        if self._memory_depth == 0:
+            peak = tracemalloc.get_traced_memory()[1] - self._memory_base
+            self.peak_memory = peak if self.peak_memory is None else max(self.peak_memory, peak)
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    # ------------------------ Export ------------------------
+    def to_dict(self):
+        return {
+            "nodes_expanded": self.nodes_expanded,
+            "nodes_generated": self.nodes_generated,
+            "peak_frontier": self.peak_frontier,
+            "heap_pushes": self.heap_pushes,
+            "heap_pops": self.heap_pops,
+            "prunes": self.prunes,
+            "cutoffs": self.cutoffs,
+            "peak_memory_bytes": self.peak_memory if self.track_memory else None,
+            "phase_seconds": dict(self.phase_times),
+        }
+
+    def to_json(self, path=None, indent=2):
+        text = json.dumps(self.to_dict(), indent=indent)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(text + "\n")
+        return text
+
+    def __repr__(self):
+        return f"SearchStats({self.to_dict()})"
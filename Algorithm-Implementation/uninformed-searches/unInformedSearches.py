@@ -1,4 +1,5 @@
 from collections import defaultdict , deque
+from contextlib import nullcontext
 
 class Graph:
     def __init__(self):
@@ -13,47 +14,69 @@ class Graph:
         for node in self.graph.keys():
             print(f"{node} -> : {self.graph[node]}")
     
-    def bfs(self, start):
+    # stats: optional SearchStats (see ../searchStats.py); counting is off when None
+    def bfs(self, start, stats=None):
         visited = set()
         queue = deque([start])
         visited.add(start)
 
-        while queue:
-            vertex = queue.popleft()
-            print(vertex, end=' ')
-            for neighbor in sorted(self.graph.get(vertex, [])):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-
-    def dfs(self, node, visited = None):
+        with stats.phase("bfs") if stats is not None else nullcontext():
+            while queue:
+                vertex = queue.popleft()
+                if stats is not None:
+                    stats.expand()
+                print(vertex, end=' ')
+                for neighbor in sorted(self.graph.get(vertex, [])):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        queue.append(neighbor)
+                        if stats is not None:
+                            stats.generate()
+                            stats.frontier(len(queue))
+
+    # depth is the recursion depth, which stats records as dfs's frontier size
+    def dfs(self, node, visited = None, stats=None, depth=1):
         if visited is None:
             visited = set()
         visited.add(node)    
         # print(node, end = ' ')
+        with stats.outer_phase("dfs") if stats is not None else nullcontext():
+            if stats is not None:
+                stats.expand()
+                stats.frontier(depth)
 
-        for neighbor in self.graph.get(node,[]):
-            if neighbor not in visited:
-                self.dfs(neighbor, visited)
-                print(neighbor, end=' ' )
+            for neighbor in self.graph.get(node,[]):
+                if neighbor not in visited:
+                    if stats is not None:
+                        stats.generate()
+                    self.dfs(neighbor, visited, stats, depth + 1)
+                    print(neighbor, end=' ' )
 
-    def depth_limited_dfs(self, start, target, limit):
+    def depth_limited_dfs(self, start, target, limit, stats=None):
         if start == target:
             print(f"Target Found!")
             return True
         if limit <= 0:
+            if stats is not None:
+                stats.cutoff()
             return False
         
-        for neighbor in self.graph.get(start, []):
-            if self.depth_limited_dfs(neighbor, target, limit - 1):
-                return True
+        with stats.outer_phase("depth_limited_dfs") if stats is not None else nullcontext():
+            if stats is not None:
+                stats.expand()
+            for neighbor in self.graph.get(start, []):
+                if stats is not None:
+                    stats.generate()
+                if self.depth_limited_dfs(neighbor, target, limit - 1, stats):
+                    return True
             
         return False
     
-    def ids(self, start, target, max_depth_limit):
+    def ids(self, start, target, max_depth_limit, stats=None):
         for depth in range(max_depth_limit + 1):
             print(f"Depth Level : {depth}")
-            isFound = self.depth_limited_dfs(start,target,depth)
+            with stats.phase(f"depth {depth}") if stats is not None else nullcontext():
+                isFound = self.depth_limited_dfs(start,target,depth, stats)
             if isFound:
                 print(f"Target Found  {depth} depth")
                 return True
@@ -64,7 +87,7 @@ class Graph:
     
 
 
-    def bds(self, start, goal):
+    def bds(self, start, goal, stats=None):
         if start == goal:
             return [start]
         
@@ -74,24 +97,31 @@ class Graph:
         visited_by_start = {start : None} # initalizer for both visited so while constructing the path itll be easier to check
         visited_by_goal = {goal : None}
 
-        while frontier_start and frontier_goal:
-            result = self.forward_frontier(frontier_start, visited_by_start ,visited_by_goal)
-            if result:
-               return self.build_path(result, visited_by_start, visited_by_goal)
-
-            result = self.forward_frontier(frontier_goal, visited_by_goal ,visited_by_start)   
-            if result:
-              return  self.build_path(result, visited_by_start, visited_by_goal) 
+        with stats.phase("bds") if stats is not None else nullcontext():
+            while frontier_start and frontier_goal:
+                result = self.forward_frontier(frontier_start, visited_by_start ,visited_by_goal, stats)
+                if result is not None:
+                   return self.build_path(result, visited_by_start, visited_by_goal)
+
+                result = self.forward_frontier(frontier_goal, visited_by_goal ,visited_by_start, stats)   
+                if result is not None:
+                  return  self.build_path(result, visited_by_start, visited_by_goal) 
+                if stats is not None:
+                    stats.frontier(len(frontier_start) + len(frontier_goal))
             
         return "No matched entires!"  
 
-    def forward_frontier(self, frontier , visited_by_self , visited_by_other):
+    def forward_frontier(self, frontier , visited_by_self , visited_by_other, stats=None):
         current = frontier.popleft()  
+        if stats is not None:
+            stats.expand()
         
         for neighbor in self.graph.get(current, []):
             if neighbor not in visited_by_self:
                 visited_by_self[neighbor] = current
-                frontier.append(current)
+                frontier.append(neighbor)
+                if stats is not None:
+                    stats.generate()
 
             if neighbor in visited_by_other: 
                 return neighbor # meeting point from both side
@@ -100,14 +130,14 @@ class Graph:
     def build_path(self, meeting_point, visited_by_start, visisted_by_goal):
         start_path = []
         node = meeting_point
-        while node:
+        while node is not None:
             start_path.append(node)
             node = visited_by_start[node]
         start_path.reverse()
 
         goal_path = []
         node = visisted_by_goal[meeting_point]
-        while node:
+        while node is not None:
             goal_path.append(node)
             node = visisted_by_goal[node]     
         
@@ -120,23 +150,24 @@ class Graph:
 
 
 
-g = Graph()
-g.add_edges(3,6)
-g.add_edges(6,0)
-g.add_edges(6,4)
-g.add_edges(3,9)
-g.add_edges(9,5)
-g.add_edges(9,7)
-
-g.iterate()
-print ("BFS :",g.bfs(3))
-print ("DFS :",g.dfs(3))
-print ("DLS :")
-if not g.depth_limited_dfs(3,4,0):
-    print("Target not Found!")
-print ("Iterative Deeping Search :")
-g.ids(3,7,2)
-print("Bidirectional Search : ", g.bds(3,7))
+if __name__ == "__main__":
+    g = Graph()
+    g.add_edges(3,6)
+    g.add_edges(6,0)
+    g.add_edges(6,4)
+    g.add_edges(3,9)
+    g.add_edges(9,5)
+    g.add_edges(9,7)
+
+    g.iterate()
+    print ("BFS :",g.bfs(3))
+    print ("DFS :",g.dfs(3))
+    print ("DLS :")
+    if not g.depth_limited_dfs(3,4,0):
+        print("Target not Found!")
+    print ("Iterative Deeping Search :")
+    g.ids(3,7,2)
+    print("Bidirectional Search : ", g.bds(3,7))
 
 
 